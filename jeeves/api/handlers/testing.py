@@ -1,9 +1,17 @@
 """Testing command handlers."""
 
+import array
+import asyncio
 import logging
-from typing import Dict, List
-
-from core.messaging import DialogConductorFactory, DialogStrategyType
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+
+from core.messaging import (
+    BaseDialogConductor,
+    DialogConductorFactory,
+    DialogStrategyType,
+)
 from core.messaging.enums import DialogStatus
 from core.telegram import create_forum_topic, forward_messages_to_topic
 from core.telegram.client import app
@@ -13,32 +21,53 @@ from pyrogram.types import Message
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class DialogSession:
+    """Active test dialog state for one user."""
+
+    conductor: BaseDialogConductor
+    msg_ids: array.array  # Ids of dialog messages for analysis
+    meta: Dict[str, Any]  # Tester info captured at dialog start
+
+
 # Store active test dialogs
-test_dialogs: Dict[int, DialogConductorFactory] = {}
-# Store dialog messages for analysis
-dialog_messages: Dict[int, List[Message]] = {}
-
-# Status and tag mappings
-STATUS_TO_TAG = {
-    DialogStatus.active: "#уточнение",  # Dialog is still active
-    DialogStatus.success: "#успех",  # Successful outcome
-    DialogStatus.blocked: "#заблокировал",  # Blocked
-    DialogStatus.rejected: "#отказ",  # Explicit rejection
-    DialogStatus.not_qualified: "#неподходит",  # Not qualified
-    DialogStatus.expired: "#истек",  # No response/dead
-    DialogStatus.stopped: "#остановлен",  # Manually stopped
-}
-
-TAG_DESCRIPTIONS = {
-    "#уточнение": "Требуется уточнение деталей",
-    "#успех": "Успешный результат диалога",
-    "#неподходит": "Клиент не соответствует критериям",
-    "#отказ": "Отказ от предложения",
-    "#тест": "Тестовый диалог с отделом продаж",
-    "#заблокировал": "Клиент заблокировал бота",
-    "#остановлен": "Диалог остановлен командой /stop",
-    "#истек": "Диалог истек без ответа",
-}
+sessions: Dict[int, DialogSession] = {}
+
+# Status and tag mappings, keyed by plain status values
+STATUS_TO_TAG = MappingProxyType(
+    {
+        DialogStatus.active.value: "#уточнение",  # Dialog is still active
+        DialogStatus.success.value: "#успех",  # Successful outcome
+        DialogStatus.blocked.value: "#заблокировал",  # Blocked
+        DialogStatus.rejected.value: "#отказ",  # Explicit rejection
+        DialogStatus.not_qualified.value: "#неподходит",  # Not qualified
+        DialogStatus.expired.value: "#истек",  # No response/dead
+        DialogStatus.stopped.value: "#остановлен",  # Manually stopped
+    }
+)
+
+TAG_DESCRIPTIONS = MappingProxyType(
+    {
+        "#уточнение": "Требуется уточнение деталей",
+        "#успех": "Успешный результат диалога",
+        "#неподходит": "Клиент не соответствует критериям",
+        "#отказ": "Отказ от предложения",
+        "#тест": "Тестовый диалог с отделом продаж",
+        "#заблокировал": "Клиент заблокировал бота",
+        "#остановлен": "Диалог остановлен командой /stop",
+        "#истек": "Диалог истек без ответа",
+    }
+)
+
+THREAD_MESSAGE_TEMPLATE = (
+    "📊 Информация о диалоге:\n"
+    "- Тестировал: {first_name} (@{username})\n"
+    "- Дата: {date:%Y-%m-%d}\n"
+    "- Итог: {tag} - {description}\n\n"
+    "Давайте обратную связь на конкретное сообщение, ответив на него, "
+    "или на весь диалог, отправляя сообщения в эту тему."
+)
 
 
 # Command handlers
@@ -57,16 +86,18 @@ async def cmd_test_dialog(client: Client, message: Message):
     """Test dialog with sales bot."""
     user_id = message.from_user.id
 
-    if user_id in test_dialogs:
+    if user_id in sessions:
         await message.reply(
             "⚠️ У вас уже есть активный тестовый диалог. Дождитесь его завершения."
         )
         return
 
+    session: Optional[DialogSession] = None
+
     async def send_message(text: str) -> None:
         sent_msg = await message.reply(text)
-        if user_id in dialog_messages:
-            dialog_messages[user_id].append(sent_msg)
+        if session:
+            session.msg_ids.append(sent_msg.id)
 
     try:
         conductor = DialogConductorFactory.create_conductor(
@@ -74,8 +105,17 @@ async def cmd_test_dialog(client: Client, message: Message):
             send_func=send_message,
             telegram_id=user_id,
         )
-        test_dialogs[user_id] = conductor
-        dialog_messages[user_id] = [message]
+        session = DialogSession(
+            conductor=conductor,
+            msg_ids=array.array("q", [message.id]),
+            meta={
+                "first_name": message.from_user.first_name,
+                "username": message.from_user.username,
+                "date": message.date,
+                "chat_id": message.chat.id,
+            },
+        )
+        sessions[user_id] = session
 
         await conductor.start_dialog()
         logger.info(f"Started test dialog for user {user_id}")
@@ -91,13 +131,13 @@ async def cmd_stop_dialog(client: Client, message: Message):
     """Stop active test dialog."""
     user_id = message.from_user.id
 
-    if user_id not in test_dialogs:
+    session = sessions.get(user_id)
+    if not session:
         await message.reply("У вас нет активного тестового диалога.")
         return
 
     try:
-        conductor = test_dialogs[user_id]
-        conductor.set_status(DialogStatus.stopped)  # Set status to stopped
+        session.conductor.set_status(DialogStatus.stopped)  # Set status to stopped
         thread_link = await forward_dialog_for_analysis(client, user_id)
         await cleanup_dialog(user_id)
         await send_completion_message(message, thread_link, stopped=True)
@@ -115,7 +155,8 @@ async def on_test_message(client: Client, message: Message):
     if message.from_user.is_bot:
         return
 
-    if user_id not in test_dialogs:
+    session = sessions.get(user_id)
+    if not session:
         if not message.text.startswith("/"):
             await message.reply(
                 "Тестовый диалог не активен. Используйте /test_dialog чтобы начать новый."
@@ -123,11 +164,8 @@ async def on_test_message(client: Client, message: Message):
         return
 
     try:
-        if user_id in dialog_messages:
-            dialog_messages[user_id].append(message)
-
-        conductor = test_dialogs[user_id]
-        is_completed, error = await conductor.handle_message(message.text)
+        session.msg_ids.append(message.id)
+        is_completed, error = await session.conductor.handle_message(message.text)
 
         if error:
             await handle_error(
@@ -155,10 +193,7 @@ async def on_test_message(client: Client, message: Message):
 # Dialog management functions
 async def cleanup_dialog(user_id: int):
     """Clean up dialog data for user."""
-    if user_id in test_dialogs:
-        del test_dialogs[user_id]
-    if user_id in dialog_messages:
-        del dialog_messages[user_id]
+    sessions.pop(user_id, None)
 
 
 async def handle_error(message: Message, error: str, user_id: int):
@@ -184,23 +219,19 @@ async def create_thread_message(
     client: Client,
     group_id: int,
     topic_id: int,
-    messages: List[Message],
+    meta: Dict[str, Any],
     status: DialogStatus,
 ) -> Message:
     """Create initial thread message with dialog info."""
-    result_tag = STATUS_TO_TAG.get(status, "#тест")
+    result_tag = STATUS_TO_TAG.get(getattr(status, "value", status), "#тест")
     tag_description = TAG_DESCRIPTIONS.get(result_tag, "")
 
     return await client.send_message(
         chat_id=group_id,
         reply_to_message_id=topic_id,
-        text=f"📊 Информация о диалоге:\n"
-        f"- Тестировал: {messages[0].from_user.first_name} "
-        f"(@{messages[0].from_user.username})\n"
-        f"- Дата: {messages[0].date.strftime('%Y-%m-%d')}\n"
-        f"- Итог: {result_tag} - {tag_description}\n\n"
-        "Давайте обратную связь на конкретное сообщение, ответив на него, "
-        "или на весь диалог, отправляя сообщения в эту тему.",
+        text=THREAD_MESSAGE_TEMPLATE.format_map(
+            {**meta, "tag": result_tag, "description": tag_description}
+        ),
     )
 
 
@@ -208,32 +239,48 @@ async def create_thread_message(
 async def forward_dialog_for_analysis(client: Client, user_id: int) -> str:
     """Forward dialog to testing group for analysis."""
     try:
-        if user_id not in dialog_messages or user_id not in test_dialogs:
+        session = sessions.get(user_id)
+        if not session:
             logger.error(f"No messages or dialog found for user {user_id}")
             return ""
 
-        messages = dialog_messages[user_id]
-        conductor = test_dialogs[user_id]
+        msg_ids = session.msg_ids
+        meta = session.meta
 
-        if not messages:
+        if not msg_ids:
             logger.error("Empty messages list")
             return ""
 
-        group = await client.get_chat(ANALYSIS_GROUP)
+        # Overlap group lookup with peer resolution for the forward
+        group, group_peer, chat_peer = await asyncio.gather(
+            client.get_chat(ANALYSIS_GROUP),
+            client.resolve_peer(ANALYSIS_GROUP),
+            client.resolve_peer(meta["chat_id"]),
+        )
         if not group or not group.id:
             logger.error("Failed to get testing group info")
             return ""
 
-        title = f"Диалог с {messages[0].from_user.first_name}"
-        topic_id = await create_forum_topic(client, group.id, title)
+        title = f"Диалог с {meta['first_name']}"
+        topic_id = await create_forum_topic(
+            client, group.id, title, channel_peer=group_peer
+        )
         if not topic_id:
             return ""
 
         thread_msg = await create_thread_message(
-            client, group.id, topic_id, messages, conductor.get_current_status()
+            client, group.id, topic_id, meta, session.conductor.get_current_status()
         )
 
-        await forward_messages_to_topic(client, messages, group.id, topic_id)
+        await forward_messages_to_topic(
+            client,
+            meta["chat_id"],
+            msg_ids,
+            group.id,
+            topic_id,
+            from_peer=chat_peer,
+            to_peer=group_peer,
+        )
 
         thread_link = f"https://t.me/c/{str(group.id)[4:]}/{topic_id}/{thread_msg.id}"
         logger.info(f"Generated thread link: {thread_link}")
@@ -4,9 +4,21 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from infrastructure.config import API_HASH, API_ID
+from infrastructure.config import (
+    ACCOUNT_CLIENT_TRANSMISSIONS,
+    ACCOUNT_CLIENT_WORKERS,
+    API_HASH,
+    API_ID,
+)
 from pyrogram import Client
-from pyrogram.errors import AuthKeyDuplicated, AuthKeyUnregistered
+from pyrogram.errors import (
+    AuthKeyDuplicated,
+    AuthKeyUnregistered,
+    FloodWait,
+    SessionRevoked,
+    UserDeactivated,
+    UserDeactivatedBan,
+)
 from utils.phone import normalize_phone
 
 from .decorators import (
@@ -18,6 +30,14 @@ from .decorators import (
 
 logger = logging.getLogger(__name__)
 
+# Errors meaning the account was banned or lost its session
+BLOCKED_ERRORS = (
+    UserDeactivated,
+    SessionRevoked,
+    AuthKeyUnregistered,
+    UserDeactivatedBan,
+)
+
 
 class AccountClient:
     """Telegram client for account operations."""
@@ -31,6 +51,11 @@ class AccountClient:
         self._connected = False
         self.phone_code_hash = None
 
+    @property
+    def is_ready(self) -> bool:
+        """Check if client is started and can be reused."""
+        return self._initialized and self.client is not None
+
     # Core Operations
     @log_operation("client_start")
     async def start(self, check_auth: bool = True) -> bool:
@@ -124,10 +149,14 @@ class AccountClient:
 
     # Message Operations
     @log_operation("send_message")
-    @handle_flood_wait("send_message", sleep=True)
+    @handle_flood_wait("send_message", propagate=(FloodWait,))
     @require_client(initialized=True)
     async def send_message(self, username: str, message: str) -> bool:
-        """Send message to specified user."""
+        """
+        Send message to specified user.
+
+        FloodWait is raised to the caller, which decides how to back off.
+        """
         await self.client.send_message(username, message)
         return True
 
@@ -143,10 +172,17 @@ class AccountClient:
 
     # Status Operations
     @log_operation("check_flood_wait")
-    @handle_flood_wait("check_flood_wait", return_time=True)
+    @handle_flood_wait(
+        "check_flood_wait",
+        return_time=True,
+        propagate=BLOCKED_ERRORS,
+    )
     @require_client(initialized=True)
     async def check_flood_wait(self) -> Optional[datetime]:
-        """Check if account is in flood wait state."""
+        """Check if account is in flood wait state.
+
+        Errors meaning the account is gone are re-raised so callers can block it.
+        """
         if not self._initialized:
             return None
 
@@ -165,6 +201,8 @@ class AccountClient:
                 session_string=self.session_string,
                 phone_number=None if self.session_string else self.phone,
                 in_memory=True,
+                workers=ACCOUNT_CLIENT_WORKERS,
+                max_concurrent_transmissions=ACCOUNT_CLIENT_TRANSMISSIONS,
             )
             return True
         except Exception as e:
@@ -2,9 +2,13 @@
 
 import asyncio
 import logging
-from typing import Dict, Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import AsyncIterator, Dict, Optional
 
 from core.db import with_queries
+from infrastructure.config import CLIENT_IDLE_TIMEOUT
 
 from .client import AccountClient
 from .models import AccountStatus
@@ -13,8 +17,25 @@ from .queries.account import AccountQueries
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _PhoneLock:
+    """Lock for one phone number with count of tasks using it."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
 class ClientManager:
-    """Centralized manager for Telegram clients."""
+    """
+    Centralized manager for Telegram clients.
+
+    Clients are pooled per phone and stay connected after use, so repeated
+    monitoring checks and sends reuse one MTProto session. A pooled client
+    lives until release_client or discard_client is called for its phone,
+    until it has not been handed out for CLIENT_IDLE_TIMEOUT (checked on
+    each get_client call), or until stop_all. Processes using the pool must
+    call stop_all before exiting.
+    """
 
     _instance = None
     _initialized = False
@@ -29,7 +50,9 @@ class ClientManager:
         """Initialize manager."""
         if not ClientManager._initialized:
             self._clients: Dict[str, AccountClient] = {}
-            self._lock = asyncio.Lock()
+            self._last_used: Dict[str, float] = {}  # Phone -> monotonic time
+            self._phone_locks: Dict[str, _PhoneLock] = {}
+            self._closed = False
             ClientManager._initialized = True
 
     @with_queries(AccountQueries)
@@ -42,6 +65,9 @@ class ClientManager:
         """
         Get or create client for phone number.
 
+        Started clients are kept in the pool and reused by later calls
+        until released, discarded or stopped with stop_all.
+
         Args:
             phone: Phone number
             session_string: Optional session string for existing sessions
@@ -50,12 +76,24 @@ class ClientManager:
         Returns:
             AccountClient if successful, None otherwise
         """
-        async with self._lock:
+        await self.stop_idle_clients()
+
+        async with self._phone_lock(phone):
+            if self._closed:
+                logger.debug(f"Client manager is stopped, not starting {phone}")
+                return None
+
             logger.debug(f"Getting client for {phone}")
 
-            if phone in self._clients:
+            cached = self._clients.get(phone)
+            if cached and cached.is_ready:
                 logger.debug(f"Returning existing client for {phone}")
-                return self._clients[phone]
+                self._last_used[phone] = monotonic()
+                return cached
+            if cached:
+                logger.debug(f"Dropping stopped client for {phone}")
+                await cached.stop()
+                self._forget(phone)
 
             # Check account status if queries provided
             check_auth = True
@@ -68,8 +106,14 @@ class ClientManager:
             # Create new client
             client = AccountClient(phone, session_string)
             if await client.start(check_auth=check_auth):
+                if self._closed:
+                    # stop_all ran while the client was starting
+                    await client.stop()
+                    return None
+
                 logger.debug(f"Successfully created client for {phone}")
                 self._clients[phone] = client
+                self._last_used[phone] = monotonic()
                 return client
 
             logger.debug(f"Failed to create client for {phone}")
@@ -85,7 +129,7 @@ class ClientManager:
             phone: Phone number to release
             queries: AccountQueries instance
         """
-        async with self._lock:
+        async with self._phone_lock(phone):
             if phone in self._clients:
                 client = self._clients[phone]
                 logger.debug(f"Releasing client for {phone}")
@@ -99,17 +143,63 @@ class ClientManager:
                         queries.session.add(account)
 
                 await client.stop()
-                del self._clients[phone]
+                self._forget(phone)
                 logger.debug(f"Client for {phone} released")
 
-    async def stop_all(self):
-        """Stop all active clients."""
-        async with self._lock:
-            logger.debug(f"Stopping all clients ({len(self._clients)} active)")
-            for client in self._clients.values():
+    async def discard_client(self, phone: str):
+        """
+        Stop and forget client without saving its session.
+
+        Used for accounts whose session is no longer valid.
+
+        Args:
+            phone: Phone number to discard
+        """
+        async with self._phone_lock(phone):
+            client = self._forget(phone)
+            if client:
+                logger.debug(f"Discarding client for {phone}")
                 await client.stop()
-            self._clients.clear()
-            logger.debug("All clients stopped")
+
+    async def stop_idle_clients(self, max_idle: float = CLIENT_IDLE_TIMEOUT) -> None:
+        """
+        Stop pooled clients that were not handed out for max_idle seconds.
+
+        Args:
+            max_idle: Seconds since a client was last returned by get_client
+        """
+        deadline = monotonic() - max_idle
+        idle = [phone for phone, used in self._last_used.items() if used < deadline]
+        for phone in idle:
+            async with self._phone_lock(phone):
+                # The client may have been reused or dropped meanwhile
+                if self._last_used.get(phone, deadline) >= deadline:
+                    continue
+                client = self._forget(phone)
+                if client:
+                    logger.debug(f"Stopping idle client for {phone}")
+                    await client.stop()
+
+    async def stop_all(self):
+        """
+        Stop all active clients.
+
+        The manager is closed afterwards: clients started concurrently are
+        stopped instead of being pooled, and get_client returns None.
+        """
+        self._closed = True
+        logger.debug(f"Stopping all clients ({len(self._clients)} active)")
+        for phone in list(self._clients):
+            async with self._phone_lock(phone):
+                client = self._forget(phone)
+                if client:
+                    await client.stop()
+        logger.debug("All clients stopped")
+
+    @property
+    def is_closed(self) -> bool:
+        """Check if stop_all was called, so get_client no longer starts clients."""
+        return self._closed
 
     def __len__(self) -> int:
         """Get number of active clients."""
@@ -130,3 +220,27 @@ class ClientManager:
         except Exception as e:
             logger.error(f"Error getting any client: {e}", exc_info=True)
             return None
+
+    def _forget(self, phone: str) -> Optional[AccountClient]:
+        """Remove client for phone from the pool and return it."""
+        self._last_used.pop(phone, None)
+        return self._clients.pop(phone, None)
+
+    @asynccontextmanager
+    async def _phone_lock(self, phone: str) -> AsyncIterator[None]:
+        """Serialize client operations for one phone number.
+
+        Different phones use different locks, so clients for several accounts
+        can be started concurrently. A lock is dropped once no task uses it.
+        """
+        entry = self._phone_locks.get(phone)
+        if entry is None:
+            entry = self._phone_locks[phone] = _PhoneLock()
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if not entry.users:
+                del self._phone_locks[phone]
@@ -4,7 +4,7 @@ import asyncio
 import functools
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Optional, TypeVar, Union
+from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
 
 from pyrogram.errors import (
     AuthKeyDuplicated,
@@ -87,7 +87,10 @@ def handle_auth_errors(operation: str) -> Callable:
 
 
 def handle_flood_wait(
-    operation: str, return_time: bool = False, sleep: bool = False
+    operation: str,
+    return_time: bool = False,
+    sleep: bool = False,
+    propagate: Tuple[Type[Exception], ...] = (),
 ) -> Callable:
     """Handle Telegram flood wait errors.
 
@@ -95,6 +98,7 @@ def handle_flood_wait(
         operation: Name of the operation for logging
         return_time: If True, returns flood wait end time instead of None
         sleep: If True, sleeps for flood wait duration instead of returning
+        propagate: Exception types re-raised to the caller instead of swallowed
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., ReturnType]:
@@ -102,6 +106,8 @@ def handle_flood_wait(
         async def wrapper(self, *args: Any, **kwargs: Any) -> ReturnType:
             try:
                 return await func(self, *args, **kwargs)
+            except propagate:
+                raise
             except FloodWait as e:
                 logger.warning(f"FloodWait during {operation}: {e.value} seconds")
                 if sleep:
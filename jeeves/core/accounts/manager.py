@@ -15,6 +15,7 @@ from .client_manager import ClientManager
 from .models.account import Account, AccountStatus
 from .queries.account import AccountQueries
 from .queries.profile import ProfileQueries
+from .safety import AccountSafety
 
 # Type hints
 if TYPE_CHECKING:
@@ -29,8 +30,11 @@ logger = logging.getLogger(__name__)
 class AccountManager:
     """Account manager."""
 
+    __slots__ = ("client_manager", "safety")
+
     def __init__(self):
         self.client_manager = ClientManager()
+        self.safety = AccountSafety()
 
     @with_queries(AccountQueries)
     async def request_code(self, phone: str, queries: AccountQueries) -> bool:
@@ -136,6 +140,11 @@ class AccountManager:
             logger.error(f"Error updating profile for {phone}: {e}")
             return False
 
+    @with_queries(AccountQueries)
+    async def get_available_account(self, queries: AccountQueries) -> Optional[Account]:
+        """Reserve least recently used account that can send messages."""
+        return await queries.get_available_account()
+
     @with_queries(AccountQueries)
     async def increment_messages(
         self, account_id: int, queries: AccountQueries
@@ -187,14 +196,8 @@ class AccountManager:
 
     @asynccontextmanager
     async def _get_client(self, phone: str, session_string: Optional[str] = None):
-        """Get client with automatic cleanup."""
-        client = None
-        try:
-            client = await self.client_manager.get_client(phone, session_string)
-            yield client
-        finally:
-            if client:
-                await client.stop()
+        """Get pooled client, which stays connected for reuse after the block."""
+        yield await self.client_manager.get_client(phone, session_string)
 
     @staticmethod
     async def _get_profile_data(client: "AccountClient", me: "User") -> dict:
@@ -226,9 +229,9 @@ class AccountManager:
         account.status = AccountStatus.active
         account.last_used_at = datetime.now(timezone.utc)
 
-    @staticmethod
-    def _increment_account_messages(account: Account) -> None:
-        """Increment account message counters."""
+    def _increment_account_messages(self, account: Account) -> None:
+        """Increment account message counters and start send cooldown."""
         account.messages_sent += 1
         account.daily_messages += 1
         account.last_used_at = datetime.now(timezone.utc)
+        account.next_sendable_at = self.safety.get_next_sendable_at(account)
@@ -7,9 +7,10 @@ from typing import TYPE_CHECKING, Annotated, Optional
 from core.db.models import Base, TimestampType
 from core.db.tables import campaigns_accounts
 from infrastructure.config import MAX_MESSAGES_PER_DAY, MAX_MESSAGES_PER_HOUR
-from sqlalchemy import BigInteger, Boolean, DateTime
+from sqlalchemy import BigInteger, Boolean, ColumnElement, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Integer, String, event
+from sqlalchemy import Index, Integer, String, and_, event, func, not_
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from utils.phone import normalize_phone
 
@@ -31,6 +32,8 @@ class AccountStatus(str, Enum):
     warming = "warming"
 
 
+_ACTIVE = AccountStatus.active  # Resolved once for usability checks
+
 DateTimeType = Annotated[
     Optional[datetime], mapped_column(DateTime(timezone=True), nullable=True)
 ]
@@ -59,6 +62,7 @@ class Account(Base):
     last_used_at: Mapped[DateTimeType]
     last_warmup_at: Mapped[DateTimeType]
     flood_wait_until: Mapped[DateTimeType]
+    next_sendable_at: Mapped[DateTimeType]  # Cooldown after last message
 
     # Relationships
     dialogs: Mapped[list["Dialog"]] = relationship(
@@ -78,30 +82,56 @@ class Account(Base):
             kwargs["phone"] = normalize_phone(kwargs["phone"])
         super().__init__(**kwargs)
 
-    @property
+    @hybrid_property
     def is_in_flood_wait(self) -> bool:
         """Check if account is in flood wait."""
         if not self.flood_wait_until:
             return False
         return self.flood_wait_until > datetime.now(timezone.utc)
 
-    @property
+    @is_in_flood_wait.inplace.expression
+    @classmethod
+    def _is_in_flood_wait_expression(cls) -> ColumnElement[bool]:
+        """SQL expression for is_in_flood_wait."""
+        return and_(
+            cls.flood_wait_until.is_not(None), cls.flood_wait_until > func.now()
+        )
+
+    @hybrid_property
     def can_be_used(self) -> bool:
         """Check if account can be used."""
         return (
-            self.status == AccountStatus.active
+            self.status == _ACTIVE
             and self.is_available
             and not self.is_in_flood_wait
             and not self.is_daily_limit_reached
             and not self.is_hourly_limit_reached
         )
 
-    @property
+    @can_be_used.inplace.expression
+    @classmethod
+    def _can_be_used_expression(cls) -> ColumnElement[bool]:
+        """SQL expression for can_be_used."""
+        return and_(
+            cls.status == _ACTIVE,
+            cls.is_available.is_(True),
+            not_(cls.is_in_flood_wait),
+            not_(cls.is_daily_limit_reached),
+            not_(cls.is_hourly_limit_reached),
+        )
+
+    @hybrid_property
     def is_daily_limit_reached(self) -> bool:
         """Check if daily message limit is reached."""
         return self.daily_messages >= MAX_MESSAGES_PER_DAY
 
-    @property
+    @is_daily_limit_reached.inplace.expression
+    @classmethod
+    def _is_daily_limit_reached_expression(cls) -> ColumnElement[bool]:
+        """SQL expression for is_daily_limit_reached."""
+        return func.coalesce(cls.daily_messages, 0) >= MAX_MESSAGES_PER_DAY
+
+    @hybrid_property
     def is_hourly_limit_reached(self) -> bool:
         """Check if hourly message limit is reached."""
         if not self.last_used_at:
@@ -113,6 +143,16 @@ class Account(Base):
 
         return self.daily_messages >= MAX_MESSAGES_PER_HOUR
 
+    @is_hourly_limit_reached.inplace.expression
+    @classmethod
+    def _is_hourly_limit_reached_expression(cls) -> ColumnElement[bool]:
+        """SQL expression for is_hourly_limit_reached."""
+        return and_(
+            cls.last_used_at.is_not(None),
+            cls.last_used_at > func.now() - timedelta(hours=1),
+            func.coalesce(cls.daily_messages, 0) >= MAX_MESSAGES_PER_HOUR,
+        )
+
     def __str__(self) -> str:
         """String representation."""
         return (
@@ -121,6 +161,15 @@ class Account(Base):
         )
 
 
+# Serves the "claim least recently used active account" query, in the
+# same ASC NULLS FIRST order, so it can stop at the first unlocked row
+Index(
+    "idx_accounts_claim",
+    Account.last_used_at.asc().nullsfirst(),
+    postgresql_where="status = 'active'",
+)
+
+
 @event.listens_for(Account, "before_insert")
 @event.listens_for(Account, "before_update")
 def normalize_account_phone(mapper, connection, target):
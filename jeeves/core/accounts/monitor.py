@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 class AccountMonitor:
     """Monitors and manages account statuses and limits."""
 
+    __slots__ = ("queries", "_running", "_task")
+
     def __init__(self, queries: AccountQueries):
         self.queries = queries
         self._running = False
@@ -86,3 +88,4 @@ class AccountMonitor:
 
         if updates:
             await self.queries.update_account(account.phone, **updates)
+            await self.queries.session.commit()
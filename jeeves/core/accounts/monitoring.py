@@ -1,12 +1,15 @@
 """Account monitoring."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from core.db import with_queries
+from infrastructure.config import MONITOR_CONCURRENCY
 
-from .client import AccountClient
+from .client import BLOCKED_ERRORS
+from .client_manager import ClientManager
 from .models import Account, AccountStatus
 from .queries.account import AccountQueries
 
@@ -16,37 +19,52 @@ logger = logging.getLogger(__name__)
 class AccountMonitor:
     """Account monitor."""
 
+    __slots__ = ("client_manager",)
+
+    def __init__(self):
+        """Initialize monitor."""
+        self.client_manager = ClientManager()
+
     @with_queries(AccountQueries)
     async def check_account(self, account: Account, queries: AccountQueries) -> bool:
-        """Check account status."""
+        """Check account status using a pooled client."""
         if account.status != AccountStatus.active:
             return False
 
+        client = None
         try:
-            client = AccountClient(account.phone, account.session_string)
-            if not await client.start():
+            client = await self.client_manager.get_client(
+                account.phone, account.session_string
+            )
+            if not client:
+                if self.client_manager.is_closed:
+                    # Shutting down, the account itself is fine
+                    return False
                 await queries.update_account(
                     account.phone, status=AccountStatus.disabled
                 )
                 return False
 
-            try:
-                flood_wait_until = await client.check_flood_wait()
-                if flood_wait_until:
-                    if flood_wait_until.tzinfo is None:
-                        flood_wait_until = flood_wait_until.replace(tzinfo=timezone.utc)
-                    await queries.update_account(
-                        account.phone, flood_wait_until=flood_wait_until
-                    )
-                    return False
-
+            flood_wait_until = await client.check_flood_wait()
+            if flood_wait_until:
+                if flood_wait_until.tzinfo is None:
+                    flood_wait_until = flood_wait_until.replace(tzinfo=timezone.utc)
                 await queries.update_account(
-                    account.phone, last_used_at=datetime.now(timezone.utc)
+                    account.phone, flood_wait_until=flood_wait_until
                 )
-                return True
+                return False
+
+            await queries.update_account(
+                account.phone, last_used_at=datetime.now(timezone.utc)
+            )
+            return True
 
-            finally:
-                await client.stop()
+        except BLOCKED_ERRORS as e:
+            logger.warning(f"Account {account.phone} is blocked: {e}")
+            await queries.update_account(account.phone, status=AccountStatus.blocked)
+            if client:
+                await self.client_manager.discard_client(account.phone)
+            return False
 
         except Exception as e:
             logger.error(f"Error checking account {account.phone}: {e}", exc_info=True)
@@ -77,11 +95,33 @@ class AccountMonitor:
                 if account.is_in_flood_wait:
                     stats["flood_wait"] += 1
 
-                if account.status == AccountStatus.active:
-                    await self.check_account(account)
+            # Checks are network bound, so run them in parallel with a cap
+            semaphore = asyncio.Semaphore(MONITOR_CONCURRENCY)
+            active_accounts = [
+                account
+                for account in accounts
+                if account.status == AccountStatus.active
+            ]
+            results = await asyncio.gather(
+                *(
+                    self._check_account_limited(account, semaphore)
+                    for account in active_accounts
+                ),
+                return_exceptions=True,
+            )
+            for account, result in zip(active_accounts, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error checking account {account.phone}: {result}")
 
             return stats
 
         except Exception as e:
             logger.error(f"Error checking accounts: {e}", exc_info=True)
             return None
+
+    async def _check_account_limited(
+        self, account: Account, semaphore: asyncio.Semaphore
+    ) -> bool:
+        """Check account once a concurrency slot is free."""
+        async with semaphore:
+            return await self.check_account(account)
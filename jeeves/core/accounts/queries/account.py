@@ -1,22 +1,85 @@
 """Account queries."""
 
+import functools
 import logging
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Set
 
+from cachetools import TTLCache
 from core import db
 from core.db.base import BaseQueries
-from sqlalchemy import and_, select
+from infrastructure.config import (
+    ACCOUNT_CACHE_SIZE,
+    ACCOUNT_CACHE_TTL,
+    MIN_MESSAGE_DELAY,
+)
+from sqlalchemy import and_, event, func, inspect, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from utils.phone import normalize_phone
 
 from ..models.account import Account, AccountStatus
 
 logger = logging.getLogger(__name__)
 
+# Accounts shared between sessions, keyed by "phone:<phone>" and "id:<id>"
+_account_cache: TTLCache = TTLCache(maxsize=ACCOUNT_CACHE_SIZE, ttl=ACCOUNT_CACHE_TTL)
+
+# Session.info key holding cache keys of accounts written in the transaction
+_WRITTEN_KEYS = "written_account_keys"
+
+
+def cached_account(key_prefix: str) -> Callable:
+    """Serve account lookups from the shared TTL cache.
+
+    The cache holds detached snapshots of column values, never a session's
+    live instance, so flushed but uncommitted changes stay in their session.
+    Hits are merged into the caller's session without a database round-trip,
+    misses are loaded by the wrapped query and cached under both keys.
+    Relationships are not cached: callers of these lookups only read the
+    account's own columns and must load dialogs or profile explicitly.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapper(self: "AccountQueries", value: Any) -> Optional[Account]:
+            if key_prefix == "phone":
+                value = normalize_phone(value)
+            cached = _account_cache.get(f"{key_prefix}:{value}")
+            if cached is not None and _is_reusable(cached):
+                try:
+                    return await self.session.merge(cached, load=False)
+                except InvalidRequestError as e:
+                    logger.debug(f"Cached account {value} is not mergeable: {e}")
+                    _invalidate_account(cached)
+
+            account = await func(self, value)
+            if account is not None and _is_cacheable(account, self.session.info):
+                snapshot = _snapshot(account)
+                _account_cache[f"phone:{account.phone}"] = snapshot
+                _account_cache[f"id:{account.id}"] = snapshot
+            return account
+
+        return wrapper
+
+    return decorator
+
+
+def clear_account_cache() -> None:
+    """Drop all cached accounts."""
+    _account_cache.clear()
+
 
 class AccountQueries(BaseQueries):
     """Queries for working with accounts."""
 
     async def update_account(self, phone: str, **updates) -> Optional[Account]:
-        """Update account with given values."""
+        """
+        Update account with given values.
+
+        Changes are flushed, not committed, so they share the caller's
+        transaction.
+        """
         try:
             account = await self.get_account_by_phone(phone)
             if not account:
@@ -25,13 +88,14 @@ class AccountQueries(BaseQueries):
             for key, value in updates.items():
                 setattr(account, key, value)
             self.session.add(account)
-            await self.session.commit()
+            await self.session.flush()
             return account
         except Exception as e:
             logger.error(f"Failed to update account {phone}: {e}")
             await self.session.rollback()
             return None
 
+    @cached_account("phone")
     async def get_account_by_phone(self, phone: str) -> Optional[Account]:
         """Get account by phone number."""
         try:
@@ -67,25 +131,66 @@ class AccountQueries(BaseQueries):
 
     async def get_available_account(self) -> Optional[Account]:
         """Get available account for messaging."""
+        return await self.claim_available_account()
+
+    async def claim_available_account(self) -> Optional[Account]:
+        """
+        Reserve least recently used account that can send messages now.
+
+        The row is locked with FOR UPDATE SKIP LOCKED only until the caller's
+        transaction commits, which keeps concurrent claims from picking the
+        same row. The reservation itself is next_sendable_at pushed forward by
+        MIN_MESSAGE_DELAY: it outlives the transaction and is replaced by the
+        real cooldown once a message is sent. last_used_at is left to mean
+        the last sent message.
+        """
         try:
             query = (
                 select(Account)
                 .where(
                     and_(
-                        Account.status == AccountStatus.active,
+                        Account.can_be_used,
                         Account.session_string.is_not(None),
-                        (Account.daily_messages < 40)
-                        | (Account.daily_messages.is_(None)),
+                        (Account.next_sendable_at.is_(None))
+                        | (Account.next_sendable_at <= func.now()),
                     )
                 )
                 .order_by(Account.last_used_at.asc().nullsfirst())
+                .limit(1)
+                .with_for_update(skip_locked=True)
             )
             result = await self.session.execute(query)
-            return result.scalar_one_or_none()
+            account = result.scalar_one_or_none()
+            if account:
+                account.next_sendable_at = datetime.now(timezone.utc) + timedelta(
+                    seconds=MIN_MESSAGE_DELAY
+                )
+                await self.session.flush()
+            return account
         except Exception as e:
-            logger.error(f"Failed to get available account: {e}", exc_info=True)
+            logger.error(f"Failed to claim available account: {e}", exc_info=True)
             return None
 
+    async def get_usable_accounts(self, limit: int) -> List[Account]:
+        """Get accounts that can be used, least loaded first."""
+        try:
+            query = (
+                select(Account)
+                .where(
+                    and_(
+                        Account.can_be_used,
+                        Account.session_string.is_not(None),
+                    )
+                )
+                .order_by(Account.messages_sent.asc())
+                .limit(limit)
+            )
+            result = await self.session.execute(query)
+            return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Failed to get usable accounts: {e}")
+            return []
+
     async def get_accounts_by_status(self, status: AccountStatus) -> List[Account]:
         """Get accounts by status."""
         try:
@@ -148,6 +253,7 @@ class AccountQueries(BaseQueries):
             return []
 
     @db.decorators.handle_sql_error("get_account_by_id")
+    @cached_account("id")
     async def get_account_by_id(self, account_id: int) -> Optional[Account]:
         """Get account by ID."""
         try:
@@ -157,3 +263,60 @@ class AccountQueries(BaseQueries):
         except Exception as e:
             logger.error(f"Failed to get account by ID {account_id}: {e}")
             return None
+
+
+# Helper functions
+def _is_reusable(account: Account) -> bool:
+    """Check that cached account has no pending or expired state."""
+    state = inspect(account)
+    return not state.modified and not state.expired_attributes
+
+
+def _is_cacheable(account: Account, session_info: dict) -> bool:
+    """Check that loaded account holds only committed values."""
+    written = session_info.get(_WRITTEN_KEYS, set())
+    return _is_reusable(account) and f"id:{account.id}" not in written
+
+
+def _snapshot(account: Account) -> Account:
+    """Copy column values of account into a detached instance."""
+    columns = inspect(Account).column_attrs
+    snapshot = Account(**{attr.key: getattr(account, attr.key) for attr in columns})
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def _invalidate_account(account: Account) -> None:
+    """Remove account from cache under all its keys."""
+    _account_cache.pop(f"phone:{account.phone}", None)
+    _account_cache.pop(f"id:{account.id}", None)
+
+
+def _cache_keys(account: Account) -> Set[str]:
+    """Get cache keys of account, including phone it had before this flush."""
+    phones = {account.phone, *inspect(account).attrs.phone.history.deleted}
+    return {f"id:{account.id}", *(f"phone:{phone}" for phone in phones)}
+
+
+@event.listens_for(Account, "after_update")
+@event.listens_for(Account, "after_delete")
+def track_written_account(mapper, connection, target):
+    """Invalidate written account now and again when its transaction ends.
+
+    Another session may re-cache the old committed row before this
+    transaction commits, so the keys are kept to be dropped once more.
+    """
+    keys = _cache_keys(target)
+    for key in keys:
+        _account_cache.pop(key, None)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_WRITTEN_KEYS, set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def invalidate_written_accounts(session):
+    """Invalidate accounts written in a committed or rolled back transaction."""
+    for key in session.info.pop(_WRITTEN_KEYS, ()):
+        _account_cache.pop(key, None)
@@ -134,19 +134,14 @@ class AccountRotation:
         except Exception as e:
             logger.error(f"Error activating new accounts: {e}", exc_info=True)
 
-    async def get_active_accounts(self, count: int = 10) -> List[Account]:
+    @with_queries(AccountQueries)
+    async def get_active_accounts(
+        self, queries: AccountQueries, count: int = 10
+    ) -> List[Account]:
         """Получение списка активных аккаунтов для работы"""
         try:
-            # Получаем все активные аккаунты
-            accounts = await AccountQueries().get_active_accounts()
-
-            # Фильтруем по возможности использования
-            available = [a for a in accounts if a.can_be_used and not a.is_flood_wait]
-
-            # Сортируем по количеству сообщений
-            available.sort(key=lambda x: x.messages_sent)
-
-            return available[:count]
+            # Фильтрация и сортировка по количеству сообщений выполняются в БД
+            return await queries.get_usable_accounts(count)
 
         except Exception as e:
             logger.error(f"Failed to get active accounts: {e}", exc_info=True)
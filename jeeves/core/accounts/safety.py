@@ -5,7 +5,6 @@ from datetime import datetime, time, timedelta, timezone
 
 from core.db import with_queries
 from infrastructure.config import (
-    MAX_MESSAGES_PER_DAY,
     MAX_MESSAGES_PER_HOUR,
     MIN_MESSAGE_DELAY,
     RESET_HOUR_UTC,
@@ -28,42 +27,35 @@ class AccountSafety:
     @staticmethod
     def can_send_message(account: Account) -> bool:
         """Check if account can send message."""
-        # Check status
+        # Check status, flood wait and daily/hourly limits
         if not account.can_be_used:
+            logger.warning(f"Account {account.phone} cannot be used now")
             return False
 
-        # Check daily limit
-        if account.daily_messages >= MAX_MESSAGES_PER_DAY:
-            logger.warning(
-                f"Daily message limit reached for {account.phone}: "
-                f"{account.daily_messages}/{MAX_MESSAGES_PER_DAY}"
-            )
+        # Check minimum delay
+        if (
+            account.last_used_at
+            and (datetime.now(timezone.utc) - account.last_used_at).total_seconds()
+            < MIN_MESSAGE_DELAY
+        ):
+            logger.warning(f"Message delay not passed for {account.phone}")
             return False
 
-        # Check hourly limit
-        if account.last_used_at:
-            messages_last_hour = 0
-            hour_ago = get_utc_now() - timedelta(hours=1)
-
-            if account.last_used_at > hour_ago:
-                messages_last_hour = account.daily_messages
-
-            if messages_last_hour >= MAX_MESSAGES_PER_HOUR:
-                logger.warning(
-                    f"Hourly message limit reached for {account.phone}: "
-                    f"{messages_last_hour}/{MAX_MESSAGES_PER_HOUR}"
-                )
-                return False
-
-            # Check minimum delay
-            if (
-                get_utc_now() - account.last_used_at
-            ).total_seconds() < MIN_MESSAGE_DELAY:
-                logger.warning(f"Message delay not passed for {account.phone}")
-                return False
-
         return True
 
+    @staticmethod
+    def get_next_sendable_at(account: Account) -> datetime:
+        """
+        Get time when account may send again after sending a message now.
+
+        Written to the account on each send, so available accounts can be
+        selected in SQL instead of checking each one here.
+        """
+        now = datetime.now(timezone.utc)
+        if account.daily_messages >= MAX_MESSAGES_PER_HOUR:
+            return now + timedelta(hours=1)
+        return now + timedelta(seconds=MIN_MESSAGE_DELAY)
+
     @staticmethod
     def get_next_reset_time() -> datetime:
         """Get next daily limit reset time."""
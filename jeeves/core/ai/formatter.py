@@ -1,15 +1,20 @@
 """Prompt formatting and management."""
 
+import itertools
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
+from core.messaging.models import HistoryMessage
 from infrastructure.config import PROMPTS_PATH
 
 logger = logging.getLogger(__name__)
 
 
+DIRECTION_MAPPING = {"in": "Client", "out": "Bot"}
+
+
 class PromptFormatError(Exception):
     """Raised when prompts cannot be formatted correctly."""
 
@@ -25,6 +30,9 @@ class PromptFormatter:
             prompts_path: Optional path to prompts file. If not provided, uses default path.
         """
         self.prompts_path = prompts_path or Path(PROMPTS_PATH)
+        # Formatted lines of the last seen dialog history, extended as it grows
+        self._history_lines: List[str] = []
+        self._history_tail: Optional[HistoryMessage] = None
         try:
             self.prompts = self._load_prompts()
             self.advisor_prompt = self.format_system_prompt(
@@ -140,7 +148,7 @@ class PromptFormatter:
 
     def format_manager_prompt(
         self,
-        dialog_history: List[Dict[str, str]],
+        dialog_history: List[HistoryMessage],
         last_message: str,
         stage: int,
         warmth: int,
@@ -175,12 +183,12 @@ class PromptFormatter:
         except Exception as e:
             raise PromptFormatError(f"Failed to format manager prompt: {e}")
 
-    def format_dialog_history(self, dialog_history: List[Dict[str, str]]) -> str:
+    def format_dialog_history(self, dialog_history: List[HistoryMessage]) -> str:
         """
         Format dialog history into a readable string.
 
         Args:
-            dialog_history: List of message dictionaries with 'direction' and 'text' keys
+            dialog_history: List of history messages
 
         Returns:
             Formatted dialog history as string
@@ -188,18 +196,23 @@ class PromptFormatter:
         Raises:
             ValueError: If dialog history messages are malformed
         """
-        DIRECTION_MAPPING = {"in": "Client", "out": "Bot"}
-        formatted_messages = []
-
-        for message in dialog_history:
+        # History only grows, so lines of already seen messages are reused
+        lines = self._history_lines
+        seen = len(lines)
+        if seen > len(dialog_history) or (
+            seen and dialog_history[seen - 1] is not self._history_tail
+        ):
+            lines.clear()
+            seen = 0
+
+        for message in itertools.islice(dialog_history, seen, None):
             try:
-                direction = message["direction"]
-                text = message["text"]
-                speaker = DIRECTION_MAPPING[direction]
-                formatted_messages.append(f"{speaker}: {text}")
+                speaker = DIRECTION_MAPPING[message.direction]
+                lines.append(f"{speaker}: {message.text}")
             except KeyError as e:
                 raise ValueError(f"Malformed message in dialog history: {e}")
             except Exception as e:
                 raise ValueError(f"Failed to format dialog history: {e}")
+            self._history_tail = message
 
-        return "\n".join(formatted_messages)
+        return "\n".join(lines)
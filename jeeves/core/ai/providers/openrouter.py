@@ -1,10 +1,14 @@
 """OpenRouter AI provider implementation."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import aiohttp
-from infrastructure.config import OPENROUTER_API_KEY, OPENROUTER_MODEL
+from infrastructure.config import (
+    AI_HTTP_POOL_SIZE,
+    OPENROUTER_API_KEY,
+    OPENROUTER_MODEL,
+)
 
 from .base import AIProvider
 
@@ -16,6 +20,9 @@ API_BASE = "https://openrouter.ai/api/v1"
 class OpenRouterProvider(AIProvider):
     """OpenRouter implementation."""
 
+    # HTTP session shared by all provider instances
+    _session: Optional[aiohttp.ClientSession] = None
+
     def __init__(self):
         """Initialize OpenRouter client."""
         self.headers = {
@@ -62,23 +69,38 @@ class OpenRouterProvider(AIProvider):
             RuntimeError: If API request fails
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{API_BASE}/chat/completions",
-                    headers=self.headers,
-                    json={
-                        "model": OPENROUTER_MODEL,
-                        "messages": messages,
-                    },
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise RuntimeError(
-                            f"API request failed with status {response.status}: {error_text}"
-                        )
-                    response_json = await response.json()
-                    logger.debug(f"OpenRouter API response: {response_json}")
-                    return response_json
+            async with self._get_session().post(
+                f"{API_BASE}/chat/completions",
+                headers=self.headers,
+                json={
+                    "model": OPENROUTER_MODEL,
+                    "messages": messages,
+                },
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(
+                        f"API request failed with status {response.status}: {error_text}"
+                    )
+                response_json = await response.json()
+                logger.debug(f"OpenRouter API response: {response_json}")
+                return response_json
         except Exception as e:
             logger.error(f"Failed to make API request: {e}")
             raise RuntimeError(f"Failed to make API request: {e}")
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close shared HTTP session."""
+        if cls._session and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Get shared HTTP session, creating it on first use."""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=AI_HTTP_POOL_SIZE)
+            )
+        return cls._session
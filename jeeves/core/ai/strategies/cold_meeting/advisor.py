@@ -2,8 +2,9 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
+from core.messaging.models import HistoryMessage
 from infrastructure.config import DEFAULT_AI_PROVIDER
 from infrastructure.logging import trace
 
@@ -25,13 +26,13 @@ class SalesAdvisor:
         self.prompt_formatter = PromptFormatter(prompts_path=prompts_path)
 
     async def get_tip(
-        self, dialog_history: List[Dict[str, str]]
+        self, dialog_history: List[HistoryMessage]
     ) -> Tuple[str, str, int, int]:
         """
         Get advice for the current conversation state.
 
         Args:
-            dialog_history: List of message dictionaries
+            dialog_history: List of history messages
 
         Returns:
             Tuple of (status, reason, warmth level, stage, advice)
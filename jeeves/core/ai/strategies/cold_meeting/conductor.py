@@ -9,7 +9,7 @@ from typing import Any, Callable, List, Optional, Set, Tuple
 from core.db.decorators import with_queries
 from core.messaging.base import BaseDialogConductor, DialogStrategyType
 from core.messaging.delivery import DeliveryInterrupted
-from core.messaging.models import DialogStatus
+from core.messaging.models import DialogStatus, HistoryMessage
 from core.messaging.queries import DialogQueries, MessageQueries
 from infrastructure.logging import trace
 
@@ -72,12 +72,8 @@ class ColdMeetingConductor(BaseDialogConductor):
 
             if delivery_result.success:
                 for msg in split_messages:
-                    self._history.append(
-                        {
-                            "direction": "out",
-                            "text": msg,
-                            "status": DialogStatus.active,
-                        }
+                    self._append_history(
+                        HistoryMessage("out", msg, DialogStatus.active)
                     )
             else:
                 logger.error(
@@ -107,7 +103,7 @@ class ColdMeetingConductor(BaseDialogConductor):
             telegram_id=self.telegram_id,
         )
 
-        self._history.append({"direction": "in", "text": message})
+        self._append_history(HistoryMessage("in", message))
 
         try:
             await self._cancel_ongoing_tasks()
@@ -177,6 +173,7 @@ class ColdMeetingConductor(BaseDialogConductor):
             status, reason, warmth, stage, advice = await self._ai_task
             response = await self.sales.get_response(
                 dialog_history=self._history,
+                last_message=self.get_last_incoming_text(),
                 status=status,
                 warmth=warmth,
                 reason=reason,
@@ -216,20 +213,14 @@ class ColdMeetingConductor(BaseDialogConductor):
                     telegram_id=self.telegram_id,
                 )
 
-                self._history.append(
-                    {
-                        "direction": "out",
-                        "text": chunk,
-                        "status": status,
-                    }
-                )
+                self._append_history(HistoryMessage("out", chunk, status))
         except DeliveryInterrupted:
             logger.info("Message delivery interrupted by new message")
             return
 
     def _handle_cancellation(self) -> Tuple[bool, Optional[str]]:
         """Handle cancellation of message processing."""
-        if len(self._history) >= 2 and self._history[-1]["direction"] == "out":
+        if len(self._history) >= 2 and self._history[-1].direction == "out":
             logger.info("Dialog completed before shutdown")
             return True, None
         logger.info("Message processing cancelled - likely due to shutdown")
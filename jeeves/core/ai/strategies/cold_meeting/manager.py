@@ -2,8 +2,9 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
+from core.messaging.models import HistoryMessage
 from infrastructure.config import DEFAULT_AI_PROVIDER
 from infrastructure.logging import trace
 
@@ -29,10 +30,13 @@ class SalesManager:
         """
         self.provider = provider or AIProvider.create(DEFAULT_AI_PROVIDER)
         self.prompt_formatter = PromptFormatter(prompts_path=prompts_path)
+        # Initial prompt depends only on static prompts, so format it once
+        self._initial_prompt = self.prompt_formatter.format_initial_prompt()
 
     async def get_response(
         self,
-        dialog_history: List[Dict[str, str]],
+        dialog_history: List[HistoryMessage],
+        last_message: str,
         status: str,
         warmth: int,
         reason: str,
@@ -44,6 +48,7 @@ class SalesManager:
 
         Args:
             dialog_history: Complete dialog history
+            last_message: Client messages sent after the last bot message
             status: Current conversation status
             warmth: Warmth level (1-10)
             reason: Reason for current status
@@ -59,15 +64,6 @@ class SalesManager:
             RuntimeError: If API request fails
         """
         try:
-            # Get all client messages after the last bot message
-            last_messages = []
-            for msg in reversed(dialog_history):
-                if msg["direction"] == "out":
-                    break
-                if msg["direction"] == "in":
-                    last_messages.append(msg["text"])
-            last_message = "\n".join(reversed(last_messages)) or ""
-
             # Format prompt for sales response
             prompt = self.prompt_formatter.format_manager_prompt(
                 dialog_history=dialog_history,
@@ -100,9 +96,8 @@ class SalesManager:
             RuntimeError: If API request fails
         """
         try:
-            prompt = self.prompt_formatter.format_initial_prompt()
             messages = [
-                {"role": "system", "content": prompt},
+                {"role": "system", "content": self._initial_prompt},
                 {"role": "user", "content": "Start conversation"},
             ]
             return await self.provider.generate_response(messages)
@@ -112,7 +107,7 @@ class SalesManager:
             raise
 
     async def generate_farewell_message(
-        self, dialog_history: List[Dict[str, str]]
+        self, dialog_history: List[HistoryMessage]
     ) -> str:
         """
         Generate farewell message with potential next steps.
@@ -1,8 +1,7 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from core.campaigns.models import Campaign
 from core.db import Base
 from core.db.tables import campaigns_audiences
 from sqlalchemy import BigInteger, Boolean, Column, DateTime
@@ -11,6 +10,9 @@ from sqlalchemy import ForeignKey, String, Table, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
+if TYPE_CHECKING:
+    from core.campaigns.models import Campaign
+
 
 class AudienceStatus(str, Enum):
     """Audience status enum."""
@@ -4,22 +4,22 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from infrastructure.config import DATABASE_URL
+from infrastructure.config import DATABASE_URL, DB_MAX_OVERFLOW, DB_POOL_SIZE
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 logger = logging.getLogger(__name__)
 
-# Create async engine
-engine = create_async_engine(DATABASE_URL)
+# Create async engine with a shared connection pool
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
 
 # Create async session factory
-async_session = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+async_session = async_sessionmaker(engine, expire_on_commit=False)
 
 
 class BaseQueries:
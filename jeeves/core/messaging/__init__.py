@@ -4,7 +4,7 @@ from .base import BaseDialogConductor, DialogStrategyType
 from .conductor import DialogConductorFactory
 from .delivery import MessageDelivery
 from .enums import DialogStatus, MessageDirection
-from .models import DeliveryOptions, DeliveryResult, Dialog, Message
+from .models import DeliveryOptions, DeliveryResult, Dialog, HistoryMessage, Message
 from .queries import DialogQueries, MessageQueries
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
     "DialogStatus",
     "DeliveryOptions",
     "DeliveryResult",
+    "HistoryMessage",
     "MessageDelivery",
     "DialogQueries",
     "MessageQueries",
@@ -5,11 +5,11 @@ import contextlib
 import logging
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Tuple
 
 from core.db.decorators import with_queries
 from core.messaging.delivery import MessageDelivery
-from core.messaging.models import DialogStatus
+from core.messaging.models import DialogStatus, HistoryMessage
 from core.messaging.queries import DialogQueries, MessageQueries
 from infrastructure.posthog import PosthogClient
 
@@ -50,7 +50,8 @@ class BaseDialogConductor:
         self.telegram_id = telegram_id
         self.prompts_path = prompts_path
         self.message_delivery = MessageDelivery()
-        self._history: List[Dict[str, Union[str, DialogStatus]]] = []
+        self._history: List[HistoryMessage] = []
+        self._last_out_index = -1  # Index of last outgoing message in history
         self.posthog = PosthogClient()
 
         # Message queue state
@@ -75,39 +76,41 @@ class BaseDialogConductor:
         """Handle incoming message."""
         raise NotImplementedError
 
-    def get_history(self) -> List[Dict[str, Union[str, DialogStatus]]]:
+    def get_history(self) -> List[HistoryMessage]:
         """Get current dialog history."""
         return self._history.copy()
 
     def get_current_status(self) -> DialogStatus:
         """Get current dialog status from history."""
-        if not self._history:
+        if self._last_out_index < 0:
             return DialogStatus.active
 
-        return next(
-            (
-                msg["status"]
-                for msg in reversed(self._history)
-                if msg.get("direction") == "out" and "status" in msg
-            ),
-            DialogStatus.active,
-        )
+        return self._history[self._last_out_index].status or DialogStatus.active
+
+    def get_last_incoming_text(self) -> str:
+        """Get client messages sent after the last outgoing message."""
+        return "\n".join(msg.text for msg in self._history[self._last_out_index + 1 :])
 
     def clear_history(self) -> None:
         """Clear dialog history."""
         self._history.clear()
+        self._last_out_index = -1
         if self._processing_task and not self._processing_task.done():
             self._processing_task.cancel()
 
     def set_status(self, status: DialogStatus) -> None:
         """Set dialog status manually."""
         if self._history:
-            if self._history[-1]["direction"] == "out":
-                self._history[-1]["status"] = status
+            if self._history[-1].direction == "out":
+                self._history[-1].status = status
             else:
-                self._history.append(
-                    {"direction": "out", "text": "Диалог остановлен", "status": status}
-                )
+                self._append_history(HistoryMessage("out", "Диалог остановлен", status))
+
+    def _append_history(self, entry: HistoryMessage) -> None:
+        """Append message to history, keeping last outgoing index up to date."""
+        self._history.append(entry)
+        if entry.direction == "out":
+            self._last_out_index = len(self._history) - 1
 
     async def _add_to_message_queue(self, message: str):
         """Add message to queue, removing oldest if full."""
@@ -2,13 +2,13 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Literal, Optional
 
 from core.db.models import Base, TimestampType, utcnow
 from core.messaging.enums import DialogStatus, MessageDirection
 from sqlalchemy import BigInteger, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -78,6 +78,14 @@ class Message(Base):
     """Message model."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Serves dialog history reads ordered by time
+        Index(
+            "idx_messages_dialog_time",
+            "dialog_id",
+            "timestamp",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     dialog_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("dialogs.id"))
@@ -100,6 +108,15 @@ class Message(Base):
         return f"[{self.timestamp}] {direction} {self.content}"
 
 
+@dataclass(slots=True)
+class HistoryMessage:
+    """Message in conductor's in-memory dialog history."""
+
+    direction: Literal["in", "out"]
+    text: str
+    status: Optional[DialogStatus] = None  # Set on outgoing messages
+
+
 @dataclass
 class DeliveryOptions:
     """Message delivery options."""
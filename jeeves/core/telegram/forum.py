@@ -1,19 +1,34 @@
 """Telegram forum topic management."""
 
+import asyncio
 import logging
+import os
+import struct
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 
 from pyrogram import Client
 from pyrogram.raw import functions, types
+from pyrogram.raw.base import InputPeer
 from pyrogram.types import Message
 
 logger = logging.getLogger(__name__)
 
+FORWARD_BATCH_SIZE = 100  # Max message ids per ForwardMessages request
 
-async def create_forum_topic(client: Client, group_id: int, title: str) -> int:
-    """Create forum topic and return topic_id and channel_peer."""
-    channel_peer = await client.resolve_peer(group_id)
+
+async def create_forum_topic(
+    client: Client,
+    group_id: int,
+    title: str,
+    channel_peer: Optional[InputPeer] = None,
+) -> int:
+    """Create forum topic and return topic_id.
+
+    Pass already resolved channel_peer to skip resolving group_id again.
+    """
+    if channel_peer is None:
+        channel_peer = await client.resolve_peer(group_id)
 
     topic = await client.invoke(
         functions.channels.CreateForumTopic(
@@ -161,18 +176,47 @@ async def get_topic_messages(
 
 
 async def forward_messages_to_topic(
-    client: Client, messages: List[Message], group_id: int, topic_id: int
+    client: Client,
+    chat_id: int,
+    msg_ids: Sequence[int],
+    group_id: int,
+    topic_id: int,
+    from_peer: Optional[InputPeer] = None,
+    to_peer: Optional[InputPeer] = None,
 ) -> None:
-    """Forward all dialog messages to the topic."""
+    """Forward dialog messages with given ids from chat to the topic.
+
+    Peers that are not passed in are resolved concurrently. Messages are
+    forwarded in batches of FORWARD_BATCH_SIZE.
+    """
     try:
-        await client.invoke(
-            functions.messages.ForwardMessages(
-                from_peer=await client.resolve_peer(messages[0].chat.id),
-                to_peer=await client.resolve_peer(group_id),
-                top_msg_id=topic_id,
-                id=[msg.id for msg in messages],
-                random_id=[client.rnd_id() for _ in messages],
-            )
+        from_peer, to_peer = await asyncio.gather(
+            _resolve(client, chat_id, from_peer),
+            _resolve(client, group_id, to_peer),
         )
+        # Telegram accepts a limited number of ids per request
+        for start in range(0, len(msg_ids), FORWARD_BATCH_SIZE):
+            batch = list(msg_ids[start : start + FORWARD_BATCH_SIZE])
+            await client.invoke(
+                functions.messages.ForwardMessages(
+                    from_peer=from_peer,
+                    to_peer=to_peer,
+                    top_msg_id=topic_id,
+                    id=batch,
+                    random_id=_random_ids(len(batch)),
+                )
+            )
     except Exception as e:
         logger.error(f"Error forwarding messages: {e}")
+
+
+async def _resolve(
+    client: Client, chat_id: int, peer: Optional[InputPeer]
+) -> InputPeer:
+    """Return already resolved peer or resolve chat_id."""
+    return peer if peer is not None else await client.resolve_peer(chat_id)
+
+
+def _random_ids(count: int) -> List[int]:
+    """Generate random int64 ids for a batch of messages in one call."""
+    return list(struct.unpack(f"<{count}q", os.urandom(8 * count)))
@@ -29,6 +29,10 @@ APP_URL: Final[str] = os.getenv("APP_URL", "https://jeeves.example.com")
 
 # Database
 DATABASE_URL: Final[str] = os.getenv("DATABASE_URL")
+DB_POOL_SIZE: Final[int] = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW: Final[int] = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+ACCOUNT_CACHE_SIZE: Final[int] = int(os.getenv("ACCOUNT_CACHE_SIZE", "1024"))
+ACCOUNT_CACHE_TTL: Final[int] = int(os.getenv("ACCOUNT_CACHE_TTL", "60"))  # seconds
 
 # OpenRouter API
 OPENROUTER_BASE_API_URL: Final[str] = os.getenv(
@@ -48,12 +52,21 @@ OPENAI_MODEL: Final[str] = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
 # AI Provider
 DEFAULT_AI_PROVIDER: Final[str] = os.getenv("DEFAULT_AI_PROVIDER", "openai")
+AI_HTTP_POOL_SIZE: Final[int] = int(
+    os.getenv("AI_HTTP_POOL_SIZE", "100")
+)  # Shared HTTP connections to AI APIs
 
 # Telegram
 API_ID: Final[int] = int(os.getenv("API_ID", "0"))
 API_HASH: Final[str] = os.getenv("API_HASH", "")
 BOT_TOKEN: Final[str] = os.getenv("BOT_TOKEN", "")
 ADMIN_TELEGRAM_ID: Final[int] = int(os.getenv("ADMIN_TELEGRAM_ID", "0"))
+ACCOUNT_CLIENT_WORKERS: Final[int] = int(
+    os.getenv("ACCOUNT_CLIENT_WORKERS", "2")
+)  # Update handler workers per pooled account client
+ACCOUNT_CLIENT_TRANSMISSIONS: Final[int] = int(
+    os.getenv("ACCOUNT_CLIENT_TRANSMISSIONS", "1")
+)  # Concurrent media transmissions per account client
 
 # Remote
 REMOTE_HOST: Final[str] = os.getenv("REMOTE_HOST", "")
@@ -71,6 +84,12 @@ WARMUP_MESSAGES: Final[int] = int(os.getenv("WARMUP_MESSAGES", "5"))
 
 # Monitoring
 CHECK_INTERVAL: Final[int] = int(os.getenv("CHECK_INTERVAL", str(60 * 5)))  # 5 minutes
+MONITOR_CONCURRENCY: Final[int] = int(
+    os.getenv("MONITOR_CONCURRENCY", "16")
+)  # Accounts checked in parallel
+CLIENT_IDLE_TIMEOUT: Final[int] = int(
+    os.getenv("CLIENT_IDLE_TIMEOUT", str(60 * 15))
+)  # Pooled client unused this long is stopped, seconds
 
 # Logging
 LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "TRACE")
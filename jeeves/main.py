@@ -4,6 +4,7 @@ import logging
 
 from api import handlers  # noqa: F401
 from core.accounts.client_manager import ClientManager
+from core.ai.providers import OpenRouterProvider
 from core.telegram import app
 from core.telegram.session import save_session
 from infrastructure.logging import setup_logging
@@ -46,6 +47,12 @@ async def main():
             except Exception as e:
                 logger.error(f"Error stopping clients: {e}", exc_info=True)
 
+            # Close shared AI HTTP session
+            try:
+                await OpenRouterProvider.close()
+            except Exception as e:
+                logger.error(f"Error closing AI session: {e}", exc_info=True)
+
             # Save session string
             try:
                 session_string = await app.export_session_string()
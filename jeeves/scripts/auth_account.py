@@ -13,6 +13,7 @@ sys.path.append(str(root_dir))
 
 # Local imports
 from core.accounts.client import AccountClient
+from core.accounts.client_manager import ClientManager
 from core.accounts.manager import AccountManager
 from core.accounts.models import AccountStatus
 from core.accounts.monitoring import AccountMonitor
@@ -143,6 +144,7 @@ class AccountAuthorizer:
             return False
 
         finally:
+            await ClientManager().stop_all()  # Disconnect pooled clients
             await asyncio.sleep(1)  # Wait for pending tasks
 
     async def verify_account_state(self, phone: str) -> None:
@@ -0,0 +1,47 @@
+"""Migration to add account send cooldown column."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from core.db import with_queries
+from sqlalchemy import text
+
+ADD_NEXT_SENDABLE_AT = """
+ALTER TABLE accounts
+    ADD COLUMN IF NOT EXISTS next_sendable_at TIMESTAMPTZ;
+"""
+
+DROP_NEXT_SENDABLE_AT = """
+ALTER TABLE accounts DROP COLUMN IF EXISTS next_sendable_at;
+"""
+
+
+@with_queries()
+async def upgrade(session) -> None:
+    """Add next_sendable_at column."""
+    await session.execute(text(ADD_NEXT_SENDABLE_AT))
+    print("Added next_sendable_at column")
+
+
+@with_queries()
+async def downgrade(session) -> None:
+    """Drop next_sendable_at column."""
+    await session.execute(text(DROP_NEXT_SENDABLE_AT))
+    print("Dropped next_sendable_at column")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in ["up", "down"]:
+        print(
+            "Usage: python -m jeeves.scripts.migrations.add_next_sendable_at [up|down]"
+        )
+        sys.exit(1)
+
+    if sys.argv[1] == "up":
+        asyncio.run(upgrade())
+    else:
+        asyncio.run(downgrade())
@@ -0,0 +1,69 @@
+"""Migration to add indexes for account claiming and dialog history."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from core.db.base import engine
+from sqlalchemy import text
+
+# CONCURRENTLY keeps tables writable while indexes build,
+# but cannot run inside a transaction block
+CREATE_ACCOUNTS_CLAIM_INDEX = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_accounts_claim
+    ON accounts (last_used_at NULLS FIRST)
+    WHERE status = 'active';
+"""
+
+CREATE_MESSAGES_DIALOG_TIME_INDEX = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_dialog_time
+    ON messages (dialog_id, timestamp);
+"""
+
+DROP_ACCOUNTS_CLAIM_INDEX = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_accounts_claim;
+"""
+
+DROP_MESSAGES_DIALOG_TIME_INDEX = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_messages_dialog_time;
+"""
+
+
+async def _execute_autocommit(*statements: str) -> None:
+    """Execute statements outside of a transaction."""
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for statement in statements:
+            await conn.execute(text(statement))
+
+
+async def upgrade() -> None:
+    """Create indexes."""
+    await _execute_autocommit(
+        CREATE_ACCOUNTS_CLAIM_INDEX, CREATE_MESSAGES_DIALOG_TIME_INDEX
+    )
+    print("Created account claim and dialog history indexes")
+
+
+async def downgrade() -> None:
+    """Drop indexes."""
+    await _execute_autocommit(
+        DROP_MESSAGES_DIALOG_TIME_INDEX, DROP_ACCOUNTS_CLAIM_INDEX
+    )
+    print("Dropped account claim and dialog history indexes")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in ["up", "down"]:
+        print(
+            "Usage: python -m jeeves.scripts.migrations.create_claim_indexes [up|down]"
+        )
+        sys.exit(1)
+
+    if sys.argv[1] == "up":
+        asyncio.run(upgrade())
+    else:
+        asyncio.run(downgrade())
@@ -16,6 +16,7 @@ sys.path.append(str(root_dir))
 load_dotenv()
 
 from core.accounts import AccountManager
+from core.accounts.client_manager import ClientManager
 from core.accounts.models import Account, AccountStatus
 from core.accounts.queries.account import AccountQueries
 from core.db import with_queries
@@ -132,6 +133,9 @@ async def sync_profiles(queries: AccountQueries):
         raise
 
     finally:
+        # Disconnect clients pooled by the syncs
+        await ClientManager().stop_all()
+
         # Log final statistics
         duration = datetime.now() - start_time
         logger.info(
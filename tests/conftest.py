@@ -18,3 +18,69 @@ load_dotenv()
 def setup_test_environment():
     """Set up test environment."""
     # Set up any test environment variables here
+
+
+@pytest.fixture
+def client_manager():
+    """Create fresh client pool, dropping the shared singleton after the test."""
+    from core.accounts.client_manager import ClientManager
+
+    ClientManager._instance = None
+    ClientManager._initialized = False
+    yield ClientManager()
+    ClientManager._instance = None
+    ClientManager._initialized = False
+
+
+@pytest.fixture
+def make_account():
+    """Create detached accounts as if they were loaded from the database."""
+    from datetime import datetime, timezone
+
+    import core.campaigns.models  # noqa: F401  # Register models Account relates to
+    from core.accounts.models.account import Account, AccountStatus
+    from sqlalchemy.orm import make_transient_to_detached
+
+    def factory(**values) -> Account:
+        now = datetime.now(timezone.utc)
+        fields = {
+            "id": 1,
+            "phone": "+79990000001",
+            "session_string": "session",
+            "status": AccountStatus.active,
+            "messages_sent": 0,
+            "daily_messages": 0,
+            "is_available": True,
+            "created_at": now,
+            "updated_at": now,
+            "last_used_at": None,
+            "last_warmup_at": None,
+            "flood_wait_until": None,
+            "next_sendable_at": None,
+            **values,
+        }
+        account = Account(**fields)
+        make_transient_to_detached(account)
+        return account
+
+    return factory
+
+
+@pytest.fixture
+def make_account_queries():
+    """Create AccountQueries over a session mock whose queries load given account."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from core.accounts.queries.account import AccountQueries
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    def factory(loaded=None) -> AccountQueries:
+        session = AsyncMock(spec=AsyncSession)
+        session.info = {}
+        session.merge.side_effect = lambda account, load: account
+        session.execute.return_value = MagicMock(
+            scalar_one_or_none=MagicMock(return_value=loaded)
+        )
+        return AccountQueries(session)
+
+    return factory
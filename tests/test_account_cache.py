@@ -0,0 +1,131 @@
+"""Tests for the shared account cache."""
+
+import pytest
+from core.accounts.models.account import Account
+from core.accounts.queries.account import (
+    _WRITTEN_KEYS,
+    _account_cache,
+    clear_account_cache,
+    track_written_account,
+)
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish each test with an empty cache."""
+    clear_account_cache()
+    yield
+    clear_account_cache()
+
+
+def _cache(account: Account) -> None:
+    _account_cache[f"phone:{account.phone}"] = account
+    _account_cache[f"id:{account.id}"] = account
+
+
+@pytest.mark.asyncio
+async def test_miss_caches_snapshot_under_both_keys(make_account, make_account_queries):
+    """Loaded account is cached by phone and by id as a column snapshot."""
+    account = make_account(daily_messages=3)
+    queries = make_account_queries(loaded=account)
+
+    assert await queries.get_account_by_phone(account.phone) is account
+
+    snapshot = _account_cache[f"phone:{account.phone}"]
+    assert _account_cache[f"id:{account.id}"] is snapshot
+    assert snapshot is not account
+    assert (snapshot.id, snapshot.daily_messages) == (account.id, 3)
+    assert inspect(snapshot).unloaded == {"dialogs", "profile", "campaigns"}
+
+
+@pytest.mark.asyncio
+async def test_hit_by_unnormalized_phone(make_account, make_account_queries):
+    """Phone with a plus is looked up under its normalized key."""
+    account = make_account(phone="+79990000001")
+    _cache(account)
+    queries = make_account_queries()
+
+    assert await queries.get_account_by_phone("+79990000001") is account
+
+    queries.session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_account_written_in_open_transaction_is_not_cached(
+    make_account, make_account_queries
+):
+    """Session that flushed changes to account does not share them."""
+    account = make_account(daily_messages=39)
+    queries = make_account_queries(loaded=account)
+    queries.session.info[_WRITTEN_KEYS] = {f"id:{account.id}"}
+
+    assert await queries.get_account_by_id(account.id) is account
+
+    assert len(_account_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_hit_is_merged_without_query(make_account, make_account_queries):
+    """Cached account is merged into the session without a round-trip."""
+    account = make_account()
+    _cache(account)
+    queries = make_account_queries()
+
+    assert await queries.get_account_by_id(account.id) is account
+
+    queries.session.merge.assert_awaited_once_with(account, load=False)
+    queries.session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_modified_cached_account_is_reloaded(make_account, make_account_queries):
+    """Cached account with pending changes is not reused."""
+    cached = make_account()
+    cached.daily_messages = 5
+    _cache(cached)
+    fresh = make_account()
+    queries = make_account_queries(loaded=fresh)
+
+    assert await queries.get_account_by_phone(cached.phone) is fresh
+
+    queries.session.merge.assert_not_awaited()
+    assert _account_cache[f"phone:{fresh.phone}"].daily_messages == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_cached_account_is_reloaded(make_account, make_account_queries):
+    """Cached account with expired attributes is not reused."""
+    cached = Account(id=1, phone="+79990000001")
+    make_transient_to_detached(cached)
+    _cache(cached)
+    fresh = make_account()
+    queries = make_account_queries(loaded=fresh)
+
+    assert await queries.get_account_by_id(1) is fresh
+
+    queries.session.merge.assert_not_awaited()
+
+
+@pytest.mark.parametrize("session_end", ["after_commit", "after_rollback"])
+def test_written_account_is_invalidated_at_flush_and_session_end(
+    session_end, make_account
+):
+    """Flush drops cached account, session end drops it again if re-cached."""
+    account = make_account()
+    _cache(account)
+    session = Session()
+    session.add(account)
+    old_phone = account.phone
+    account.phone = "+79990000002"
+
+    track_written_account(None, None, account)
+    assert len(_account_cache) == 0
+
+    # Another session re-caches the committed row before this one ends
+    _cache(make_account())
+    getattr(session.dispatch, session_end)(session)
+    assert f"phone:{old_phone}" not in _account_cache
+    assert len(_account_cache) == 0
+    assert not session.info
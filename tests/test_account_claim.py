@@ -0,0 +1,53 @@
+"""Tests for claiming accounts for sending."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from infrastructure.config import MIN_MESSAGE_DELAY
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+
+@pytest.mark.asyncio
+async def test_claim_reserves_account_without_touching_last_used_at(
+    make_account, make_account_queries
+):
+    """Claim pushes back next_sendable_at and keeps last sent time."""
+    last_used_at = datetime.now(timezone.utc) - timedelta(hours=3)
+    account = make_account(last_used_at=last_used_at)
+    queries = make_account_queries(account)
+
+    assert await queries.claim_available_account() is account
+
+    assert account.last_used_at == last_used_at
+    reserved_for = account.next_sendable_at - datetime.now(timezone.utc)
+    assert timedelta(0) < reserved_for <= timedelta(seconds=MIN_MESSAGE_DELAY)
+    queries.session.flush.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_accounts_cooling_down(make_account, make_account_queries):
+    """Claim query filters on next_sendable_at and skips locked rows."""
+    queries = make_account_queries(make_account())
+
+    await queries.claim_available_account()
+
+    query = queries.session.execute.await_args.args[0]
+    sql = " ".join(str(query.compile(dialect=postgresql.dialect())).split())
+    assert (
+        "(accounts.next_sendable_at IS NULL "
+        "OR accounts.next_sendable_at <= now())" in sql
+    )
+    assert sql.endswith("FOR UPDATE SKIP LOCKED")
+
+
+def test_claim_index_matches_claim_order(make_account):
+    """Claim index is sorted like the claim query, nulls first."""
+    index = next(
+        index
+        for index in make_account().__table__.indexes
+        if index.name == "idx_accounts_claim"
+    )
+
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "(last_used_at ASC NULLS FIRST)" in ddl
@@ -0,0 +1,36 @@
+"""Tests for the account manager."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from core.accounts.manager import AccountManager
+from core.accounts.queries.account import AccountQueries
+from infrastructure.config import MAX_MESSAGES_PER_HOUR, MIN_MESSAGE_DELAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "daily_messages, cooldown",
+    [
+        (0, timedelta(seconds=MIN_MESSAGE_DELAY)),
+        (MAX_MESSAGES_PER_HOUR, timedelta(hours=1)),
+    ],
+)
+async def test_sent_message_sets_next_sendable_at(
+    client_manager, make_account, daily_messages, cooldown
+):
+    """Counting a sent message stores when the account may send again."""
+    account = make_account(daily_messages=daily_messages)
+
+    with patch.object(
+        AccountQueries, "get_account_by_id", AsyncMock(return_value=account)
+    ):
+        assert await AccountManager().increment_messages(
+            account.id, session=AsyncMock(spec=AsyncSession)
+        )
+
+    assert account.daily_messages == daily_messages + 1
+    remaining = account.next_sendable_at - datetime.now(timezone.utc)
+    assert cooldown - timedelta(seconds=5) < remaining <= cooldown
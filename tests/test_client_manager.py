@@ -0,0 +1,92 @@
+"""Tests for the Telegram client pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from core.accounts.queries.account import AccountQueries
+from infrastructure.config import CLIENT_IDLE_TIMEOUT
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+def manager(client_manager):
+    """Client pool whose accounts are not found in the database."""
+    with patch.object(
+        AccountQueries, "get_account_by_phone", AsyncMock(return_value=None)
+    ):
+        yield client_manager
+
+
+def _fake_client(start_delay: float = 0):
+    """Create AccountClient stub that starts successfully."""
+
+    async def start(check_auth=True):
+        await asyncio.sleep(start_delay)
+        return True
+
+    client = MagicMock(is_ready=True)
+    client.start = AsyncMock(side_effect=start)
+    client.stop = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_stop_all_stops_client_started_concurrently(manager):
+    """A client finishing its start during shutdown is not pooled."""
+    client = _fake_client(start_delay=0.01)
+
+    with patch("core.accounts.client_manager.AccountClient", return_value=client):
+        task = asyncio.create_task(
+            manager.get_client("+79990000001", session=AsyncMock(spec=AsyncSession))
+        )
+        await asyncio.sleep(0)
+        await manager.stop_all()
+        result = await task
+
+    assert result is None
+    client.stop.assert_awaited()
+    assert len(manager) == 0
+    assert (
+        await manager.get_client("+79990000002", session=AsyncMock(spec=AsyncSession))
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_phone_locks_are_dropped_when_unused(manager):
+    """Per-phone locks do not accumulate after operations finish."""
+    with patch(
+        "core.accounts.client_manager.AccountClient",
+        side_effect=lambda *args: _fake_client(),
+    ):
+        for i in range(3):
+            phone = f"+7999000000{i}"
+            await manager.get_client(phone, session=AsyncMock(spec=AsyncSession))
+            await manager.discard_client(phone)
+
+    assert manager._phone_locks == {}
+    assert len(manager) == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_clients_are_stopped_on_next_get_client(manager):
+    """Clients not handed out for CLIENT_IDLE_TIMEOUT leave the pool."""
+    idle, recent, fresh = _fake_client(), _fake_client(), _fake_client()
+    steps = [
+        (0.0, "+79990000001"),
+        (CLIENT_IDLE_TIMEOUT / 2, "+79990000002"),
+        (CLIENT_IDLE_TIMEOUT + 1.0, "+79990000003"),
+    ]
+
+    with patch(
+        "core.accounts.client_manager.AccountClient",
+        side_effect=[idle, recent, fresh],
+    ):
+        for now, phone in steps:
+            with patch("core.accounts.client_manager.monotonic", return_value=now):
+                await manager.get_client(phone, session=AsyncMock(spec=AsyncSession))
+
+    idle.stop.assert_awaited_once()
+    recent.stop.assert_not_awaited()
+    assert len(manager) == 2
@@ -0,0 +1,45 @@
+"""Tests for dialog history tracking in conductors."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from core.messaging.base import BaseDialogConductor
+from core.messaging.enums import DialogStatus
+from core.messaging.models import HistoryMessage
+
+
+@pytest.fixture
+def conductor():
+    """Create base conductor without external services."""
+    with patch("core.messaging.base.PosthogClient"):
+        return BaseDialogConductor(send_func=AsyncMock())
+
+
+def test_empty_history(conductor):
+    """Empty history is active and has no pending client text."""
+    assert conductor.get_current_status() == DialogStatus.active
+    assert conductor.get_last_incoming_text() == ""
+
+
+def test_last_incoming_text_after_last_outgoing(conductor):
+    """Only client messages after the last bot message are returned."""
+    conductor._append_history(HistoryMessage("in", "old"))
+    conductor._append_history(HistoryMessage("out", "hello", DialogStatus.active))
+    conductor._append_history(HistoryMessage("in", "first"))
+    conductor._append_history(HistoryMessage("in", "second"))
+
+    assert conductor.get_last_incoming_text() == "first\nsecond"
+    assert conductor.get_current_status() == DialogStatus.active
+
+
+def test_status_follows_last_outgoing(conductor):
+    """Current status comes from the last outgoing message."""
+    conductor._append_history(HistoryMessage("out", "hello", DialogStatus.active))
+    conductor._append_history(HistoryMessage("in", "no"))
+    conductor.set_status(DialogStatus.stopped)
+
+    assert conductor.get_current_status() == DialogStatus.stopped
+    assert conductor.get_last_incoming_text() == ""
+
+    conductor.clear_history()
+    assert conductor.get_current_status() == DialogStatus.active
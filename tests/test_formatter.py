@@ -0,0 +1,50 @@
+"""Tests for prompt formatting."""
+
+from pathlib import Path
+
+import pytest
+from core.ai.formatter import PromptFormatter
+from core.messaging.models import HistoryMessage
+
+PROMPTS_PATH = (
+    Path(__file__).parent.parent
+    / "jeeves"
+    / "core"
+    / "ai"
+    / "strategies"
+    / "cold_meeting"
+    / "prompts.yaml"
+)
+
+
+@pytest.fixture
+def formatter():
+    """Create formatter with cold meeting prompts."""
+    return PromptFormatter(prompts_path=PROMPTS_PATH)
+
+
+def test_format_growing_history(formatter):
+    """Appended messages extend previously formatted history."""
+    history = [HistoryMessage("out", "Hello"), HistoryMessage("in", "Hi")]
+    assert formatter.format_dialog_history(history) == "Bot: Hello\nClient: Hi"
+
+    history.append(HistoryMessage("out", "How are you?"))
+    assert formatter.format_dialog_history(history) == (
+        "Bot: Hello\nClient: Hi\nBot: How are you?"
+    )
+
+
+def test_format_replaced_history(formatter):
+    """A different or cleared history is formatted from scratch."""
+    formatter.format_dialog_history([HistoryMessage("out", "Hello")])
+
+    assert formatter.format_dialog_history([HistoryMessage("in", "Other")]) == (
+        "Client: Other"
+    )
+    assert formatter.format_dialog_history([]) == ""
+
+
+def test_format_malformed_history(formatter):
+    """Unknown directions are rejected."""
+    with pytest.raises(ValueError):
+        formatter.format_dialog_history([HistoryMessage("sideways", "?")])
@@ -0,0 +1,30 @@
+"""Tests for forum topic helpers."""
+
+import array
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from core.telegram.forum import FORWARD_BATCH_SIZE, forward_messages_to_topic
+
+
+@pytest.mark.asyncio
+async def test_forward_messages_in_batches():
+    """Long dialogs are forwarded in batches Telegram accepts."""
+    client = MagicMock()
+    client.invoke = AsyncMock()
+    client.resolve_peer = AsyncMock()
+    msg_ids = array.array("q", range(1, 2 * FORWARD_BATCH_SIZE + 51))
+
+    await forward_messages_to_topic(
+        client, 1, msg_ids, 2, 3, from_peer="from", to_peer="to"
+    )
+
+    client.resolve_peer.assert_not_called()
+    requests = [call.args[0] for call in client.invoke.await_args_list]
+    assert [len(r.id) for r in requests] == [
+        FORWARD_BATCH_SIZE,
+        FORWARD_BATCH_SIZE,
+        50,
+    ]
+    assert [i for r in requests for i in r.id] == list(msg_ids)
+    assert all(len(r.random_id) == len(r.id) for r in requests)
@@ -0,0 +1,126 @@
+"""Tests for account monitoring."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from core.accounts.models import AccountStatus
+from core.accounts.monitoring import AccountMonitor
+from core.accounts.queries.account import AccountQueries
+from pyrogram.errors import UserDeactivated
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _account(phone: str, status: AccountStatus = AccountStatus.active):
+    """Create account stub with fields used by the monitor."""
+    return SimpleNamespace(
+        id=1, phone=phone, status=status, session_string="s", is_in_flood_wait=False
+    )
+
+
+@pytest.fixture
+def pooled_client(client_manager):
+    """Serve one started client stub from the pool for any account."""
+    client = MagicMock(is_ready=True)
+    client.start = AsyncMock(return_value=True)
+    client.stop = AsyncMock()
+    client.check_flood_wait = AsyncMock(return_value=None)
+
+    with (
+        patch(
+            "core.accounts.client_manager.AccountClient", return_value=client
+        ) as client_cls,
+        patch.object(
+            AccountQueries, "get_account_by_phone", AsyncMock(return_value=None)
+        ),
+        patch.object(AccountQueries, "update_account", AsyncMock()) as update,
+    ):
+        yield SimpleNamespace(
+            client=client, client_cls=client_cls, update=update, pool=client_manager
+        )
+
+
+@pytest.mark.asyncio
+async def test_check_accounts_runs_checks_concurrently_with_limit():
+    """Active accounts are checked in parallel, capped by MONITOR_CONCURRENCY."""
+    accounts = [_account(f"+7999000000{i}") for i in range(6)]
+    accounts.append(_account("+79990000099", AccountStatus.disabled))
+
+    in_flight = 0
+    max_in_flight = 0
+    checked = []
+
+    async def fake_check(self, account):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        checked.append(account.phone)
+        return True
+
+    with (
+        patch.object(
+            AccountQueries, "get_all_accounts", AsyncMock(return_value=accounts)
+        ),
+        patch.object(AccountMonitor, "check_account", fake_check),
+        patch("core.accounts.monitoring.MONITOR_CONCURRENCY", 2),
+    ):
+        stats = await AccountMonitor().check_accounts(
+            session=AsyncMock(spec=AsyncSession)
+        )
+
+    assert stats["total"] == 7
+    assert stats["active"] == 6
+    assert stats["disabled"] == 1
+    assert sorted(checked) == sorted(a.phone for a in accounts[:6])
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_check_account_reuses_pooled_client(pooled_client):
+    """Repeated checks of one account start its client only once."""
+    monitor = AccountMonitor()
+    account = _account("+79990000001")
+
+    for _ in range(2):
+        assert await monitor.check_account(
+            account, session=AsyncMock(spec=AsyncSession)
+        )
+
+    pooled_client.client_cls.assert_called_once()
+    pooled_client.client.start.assert_awaited_once()
+    assert pooled_client.client.check_flood_wait.await_count == 2
+    pooled_client.client.stop.assert_not_awaited()
+    assert len(pooled_client.pool) == 1
+
+
+@pytest.mark.asyncio
+async def test_check_account_blocks_and_discards_client(pooled_client):
+    """Deactivated account is marked blocked and its client leaves the pool."""
+    pooled_client.client.check_flood_wait.side_effect = UserDeactivated()
+    account = _account("+79990000001")
+
+    assert not await AccountMonitor().check_account(
+        account, session=AsyncMock(spec=AsyncSession)
+    )
+
+    pooled_client.update.assert_awaited_with(
+        account.phone, status=AccountStatus.blocked
+    )
+    pooled_client.client.stop.assert_awaited_once()
+    assert len(pooled_client.pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_check_account_after_stop_all_keeps_status(pooled_client):
+    """Checks running during shutdown do not disable healthy accounts."""
+    await pooled_client.pool.stop_all()
+
+    assert not await AccountMonitor().check_account(
+        _account("+79990000001"), session=AsyncMock(spec=AsyncSession)
+    )
+
+    pooled_client.client.start.assert_not_awaited()
+    pooled_client.update.assert_not_awaited()
@@ -0,0 +1,22 @@
+"""Tests for account safety checks."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from core.accounts.safety import AccountSafety
+
+
+@pytest.mark.parametrize(
+    "last_used_ago, can_send",
+    [(None, True), (timedelta(hours=3), True), (timedelta(seconds=5), False)],
+)
+def test_can_send_message_checks_delay_since_last_use(
+    make_account, last_used_ago, can_send
+):
+    """Timezone-aware last_used_at is compared with the minimum delay."""
+    account = make_account(
+        daily_messages=2,
+        last_used_at=last_used_ago and datetime.now(timezone.utc) - last_used_ago,
+    )
+
+    assert AccountSafety.can_send_message(account) is can_send